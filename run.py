@@ -21,7 +21,7 @@ def test_websearch_invoke():
     )
 
     for i, res in enumerate(result.data, 1):
-        logger.info(f"{i}. {len(res.content)} \t chars from '{res.title[:30]}...' - {res.url}")
+        logger.info("%s. %s \t chars from '%s...' - %s", i, len(res.content), res.title[:30], res.url)
 
 if __name__ == "__main__":
     test_websearch_invoke()
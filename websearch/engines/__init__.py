@@ -0,0 +1,73 @@
+# websearch/engines/__init__.py
+
+# Standard Library
+import asyncio
+from itertools import zip_longest
+# Third Party
+import httpx
+# Core
+from websearch.engines import bing, duckduckgo
+
+# Direct engine integrations by backend name. Each entry is an
+# `async def search(client, query, safesearch, max_results) -> list[dict]`
+# doing a single httpx GET against the engine's HTML endpoint, parsed with
+# selectolax — no ddgs layer, so multiple backends can fan out on one
+# event loop over a shared HTTP/2 connection pool.
+DIRECT_ENGINES = {
+    "duckduckgo": duckduckgo.search,
+    "bing": bing.search,
+}
+
+_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (X11; Linux x86_64; rv:128.0) Gecko/20100101 Firefox/128.0',
+    'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.1',
+    'Accept-Encoding': 'gzip, deflate, br, zstd',
+}
+
+
+async def search_all(query: str, safesearch: str = "moderate", max_results: int = 5, timeout: int = 10) -> list:
+    """
+    Fan a query out to every direct engine concurrently and merge results.
+
+    Engines share one pooled AsyncClient, run under gather, and their
+    result lists are interleaved so no single backend dominates the head
+    of the merged list. Duplicates are dropped by canonicalized URL. An
+    engine that errors (blocked, reshaped markup) just contributes nothing.
+
+    Args:
+        query (str): The search query string.
+        safesearch (str): One of "off", "moderate", "strict".
+        max_results (int): Maximum number of merged results to return.
+        timeout (int): Per-request timeout in seconds.
+
+    Returns:
+        list: Merged result dicts with "href", "title" and "body" keys.
+    """
+    async with httpx.AsyncClient(
+        http2=True,
+        timeout=timeout,
+        follow_redirects=True,
+        headers=_HEADERS
+    ) as client:
+        outcomes = await asyncio.gather(
+            *[engine(client, query, safesearch, max_results) for engine in DIRECT_ENGINES.values()],
+            return_exceptions=True
+        )
+
+    merged = []
+    seen = set()
+    for group in zip_longest(*[o for o in outcomes if isinstance(o, list)]):
+        for item in group:
+            if item is None:
+                continue
+            key = item["href"].rstrip('/').lower()
+            if key in seen:
+                continue
+            seen.add(key)
+            merged.append(item)
+            if len(merged) >= max_results:
+                return merged
+    return merged
+
+
+__all__ = ["DIRECT_ENGINES", "search_all", "bing", "duckduckgo"]
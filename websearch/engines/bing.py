@@ -0,0 +1,61 @@
+# websearch/engines/bing.py
+
+# Third Party
+import httpx
+
+try:
+    # Third Party
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+_ENDPOINT = "https://www.bing.com/search"
+
+# Bing reads the adult filter from the SRCHHPGUSR cookie
+_SAFESEARCH = {"off": "OFF", "moderate": "DEMOTE", "strict": "STRICT"}
+
+
+async def search(client: httpx.AsyncClient, query: str, safesearch: str = "moderate", max_results: int = 5) -> list:
+    """
+    Search Bing directly via its HTML results page.
+
+    Args:
+        client (httpx.AsyncClient): Pooled client to issue the request on.
+        query (str): The search query string.
+        safesearch (str): One of "off", "moderate", "strict".
+        max_results (int): Maximum number of results to return.
+
+    Returns:
+        list: Result dicts with "href", "title" and "body" keys, matching
+        the shape ddgs returns so callers need no translation.
+    """
+    if LexborHTMLParser is None:
+        return []
+
+    # Sent as a Cookie header: per-request cookies= is deprecated on a
+    # shared client in httpx 0.28
+    response = await client.get(
+        _ENDPOINT,
+        params={"q": query, "count": max_results},
+        headers={"Cookie": f"SRCHHPGUSR=ADLT={_SAFESEARCH.get(safesearch, 'DEMOTE')}"}
+    )
+    response.raise_for_status()
+
+    tree = LexborHTMLParser(response.text)
+    results = []
+    for node in tree.css("li.b_algo"):
+        link = node.css_first("h2 a")
+        if link is None:
+            continue
+        href = link.attributes.get("href")
+        if not href or not href.startswith("http"):
+            continue
+        snippet = node.css_first("div.b_caption p") or node.css_first("p")
+        results.append({
+            "href": href,
+            "title": link.text(strip=True),
+            "body": snippet.text(strip=True) if snippet is not None else ""
+        })
+        if len(results) >= max_results:
+            break
+    return results
@@ -0,0 +1,76 @@
+# websearch/engines/duckduckgo.py
+
+# Standard Library
+from urllib.parse import parse_qs, urlparse
+# Third Party
+import httpx
+
+try:
+    # Third Party
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
+
+# DuckDuckGo's no-JS HTML endpoint; one GET returns a parseable result page.
+_ENDPOINT = "https://html.duckduckgo.com/html/"
+
+# kp parameter values for the standard safesearch levels
+_SAFESEARCH = {"off": "-2", "moderate": "-1", "strict": "1"}
+
+
+def _unwrap_href(href: str) -> str:
+    """
+    Resolve DuckDuckGo's redirect links to the target URL.
+
+    Result anchors point at `duckduckgo.com/l/?uddg=<encoded target>`;
+    the real URL is in the `uddg` query parameter.
+    """
+    if "duckduckgo.com/l/" not in href:
+        return href
+    if href.startswith("//"):
+        href = "https:" + href
+    target = parse_qs(urlparse(href).query).get("uddg")
+    return target[0] if target else href
+
+
+async def search(client: httpx.AsyncClient, query: str, safesearch: str = "moderate", max_results: int = 5) -> list:
+    """
+    Search DuckDuckGo directly via its HTML endpoint.
+
+    Args:
+        client (httpx.AsyncClient): Pooled client to issue the request on.
+        query (str): The search query string.
+        safesearch (str): One of "off", "moderate", "strict".
+        max_results (int): Maximum number of results to return.
+
+    Returns:
+        list: Result dicts with "href", "title" and "body" keys, matching
+        the shape ddgs returns so callers need no translation.
+    """
+    if LexborHTMLParser is None:
+        return []
+
+    response = await client.get(
+        _ENDPOINT,
+        params={"q": query, "kp": _SAFESEARCH.get(safesearch, "-1")}
+    )
+    response.raise_for_status()
+
+    tree = LexborHTMLParser(response.text)
+    results = []
+    for node in tree.css("div.result"):
+        link = node.css_first("a.result__a")
+        if link is None:
+            continue
+        href = link.attributes.get("href")
+        if not href:
+            continue
+        snippet = node.css_first("a.result__snippet")
+        results.append({
+            "href": _unwrap_href(href),
+            "title": link.text(strip=True),
+            "body": snippet.text(strip=True) if snippet is not None else ""
+        })
+        if len(results) >= max_results:
+            break
+    return results
@@ -1,6 +1,7 @@
 # Standard Library
 import json
 import logging
+import logging.handlers
 import os
 import pprint
 from typing import Any, Optional, Union
@@ -8,6 +9,10 @@ from typing import Any, Optional, Union
 from pydantic import BaseModel
 from rich.logging import RichHandler
 
+# Configured loggers by name; turns repeat create_logger calls into a dict
+# lookup instead of re-running level parsing and handler setup.
+_LOGGER_CACHE = {}
+
 
 class LoggerFactory:
     @staticmethod
@@ -18,11 +23,12 @@ class LoggerFactory:
         env: Optional[str] = None,
         log_to_file: bool = False,
         log_to_api: bool = False,
-        log_file_path: str = "logs/app.log"
+        log_file_path: str = "logs/app.log",
+        buffered: bool = False
     ):
         """
         Create a logger with explicit configuration parameters.
-        
+
         Args:
             name: Logger name
             log_level: Logging level (defaults to INFO)
@@ -31,11 +37,22 @@ class LoggerFactory:
             log_to_file: Whether to log to file
             log_to_api: Whether to log to API
             log_file_path: Path for log file
+            buffered: Buffer console records in memory and flush in batches
+                instead of writing/flushing per record (hot-path loggers)
         """
+        # Fast path: logger was already fully configured by a previous call;
+        # just refresh the cheap, idempotent bits and return it
+        cached = _LOGGER_CACHE.get(name)
+        if cached is not None and cached.handlers:
+            if log_level is not None:
+                cached.setLevel(log_level.upper() if isinstance(log_level, str) else log_level)
+            cached.disabled = not enabled
+            return cached
+
         # Set defaults
         if log_level is None:
             log_level = "INFO"
-        
+
         if env is None:
             env = os.environ.get("AI_ENV", "production")
         
@@ -50,6 +67,7 @@ class LoggerFactory:
         logger.disabled = not enabled
 
         if logger.handlers:
+            _LOGGER_CACHE[name] = logger
             return logger  # Prevent duplicate handlers
 
         # Formatters
@@ -76,6 +94,18 @@ class LoggerFactory:
 
         console_handler.setLevel(log_level)
         console_handler.setFormatter(logging.Formatter(console_format))
+
+        if buffered:
+            # Accumulate records in memory and emit them in batches so hot
+            # loops don't pay a console write + flush per record. Errors
+            # (and logging shutdown) force an immediate flush.
+            console_handler = logging.handlers.MemoryHandler(
+                capacity=256,
+                flushLevel=logging.ERROR,
+                target=console_handler
+            )
+            console_handler.setLevel(log_level)
+
         logger.addHandler(console_handler)
 
         # Optional File Logging
@@ -104,6 +134,7 @@ class LoggerFactory:
 
         logger.propagate = False
 
+        _LOGGER_CACHE[name] = logger
         return logger
 
     @staticmethod
@@ -127,10 +158,19 @@ class LoggerFactory:
         if disabled:
             logger.handlers = []
 
+# Caps on log payload formatting: pretty-printers allocate large
+# intermediate strings for big payloads that mostly get scrolled past
+_MAX_FORMAT_CHARS = 4096
+_MAX_JSON_REPARSE_BYTES = 65536
+
+
 def format_for_log(message: str, data: Any) -> str:
     """
     Format a message and data object nicely for logging.
 
+    Output is truncated at _MAX_FORMAT_CHARS so oversized payloads
+    (full result sets, decoded HTML) never dominate formatting cost.
+
     Args:
         message (str): The log message prefix.
         data (Any): The data object to pretty-print.
@@ -140,17 +180,19 @@ def format_for_log(message: str, data: Any) -> str:
     """
     try:
         if isinstance(data, BaseModel):
-            data_dict = data.model_dump()
-            # formatted_data = json.dumps(data_dict, indent=2, default=str)
-            formatted_data = pprint.pformat(data_dict)
+            # model_dump_json serializes entirely in pydantic-core (Rust) —
+            # no intermediate Python dict, no stdlib json pass
+            formatted_data = data.model_dump_json(indent=2)
         elif isinstance(data, (dict, list)):
             formatted_data = json.dumps(data, indent=2, default=str)
         elif isinstance(data, bytes):
             # CRITICAL CHANGE: Add errors='replace' for robust decoding
             try:
                 formatted_data = data.decode("utf-8", errors='replace')
-                # Optionally, try to parse as JSON if it looks like JSON
-                if formatted_data.strip().startswith(("{", "[")):
+                # Optionally, try to parse as JSON if it looks like JSON —
+                # but not for huge payloads, where the reparse cost outweighs
+                # any readability gain
+                if len(formatted_data) < _MAX_JSON_REPARSE_BYTES and formatted_data.strip().startswith(("{", "[")):
                     try:
                         parsed_json = json.loads(formatted_data)
                         formatted_data = json.dumps(parsed_json, indent=2, default=str)
@@ -166,4 +208,7 @@ def format_for_log(message: str, data: Any) -> str:
         # Fallback if something goes wrong
         formatted_data = f"<Could not format data: {e}>"
 
+    if len(formatted_data) > _MAX_FORMAT_CHARS:
+        formatted_data = formatted_data[:_MAX_FORMAT_CHARS] + "…[truncated]"
+
     return f"{message}:\n{formatted_data}"
\ No newline at end of file
@@ -1,12 +1,146 @@
 # Standard Library
-import requests
-from urllib.parse import urlparse
+import asyncio
+import multiprocessing
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Literal
 # Third Party
+import httpx
 import trafilatura
+from trafilatura.settings import use_config
+
+try:
+    # Optional: Lexbor keeps the DOM in C and is ~4-5x faster than a full
+    # trafilatura pass; install with `websearch[fast]`
+    # Third Party
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:
+    LexborHTMLParser = None
 # Core
 from websearch import SearchResult, SearchResults
 from websearch.logging import *
 
+# Compiled once; collapses any whitespace run in a single C-level pass
+# instead of tokenizing the whole document into a list and re-joining.
+_WS_RE = re.compile(r'\s+')
+
+# Upper bound on cached extractions; oldest entries are evicted first
+_CACHE_MAXSIZE = 512
+
+# HEAD-probe size cutoff. Ordinary article pages routinely exceed the
+# per-fetch byte budget and the capped streaming GET still extracts full
+# content from them, so the probe only rejects file-download-class
+# resources where even the capped transfer is pointless.
+_HEAD_SKIP_BYTES = 5 * 1024 * 1024
+
+# Built once at import so sustained scrapes don't reparse the same settings
+# per document. Bodies under 50 chars are noise (cookie banners, error
+# stubs) and get discarded inside trafilatura instead of downstream.
+_TRAFILATURA_CONFIG = use_config()
+_TRAFILATURA_CONFIG.set('DEFAULT', 'MIN_OUTPUT_SIZE', '50')
+
+
+def _fast_extract_text(content: str):
+    """
+    Pull visible text from the main content nodes via selectolax/Lexbor.
+
+    Args:
+        content (str): Raw HTML to extract from.
+
+    Returns:
+        Optional[str]: Extracted text, or None when no content node exists.
+    """
+    tree = LexborHTMLParser(content)
+    for node in tree.css('script,style,nav,header,footer,aside'):
+        node.decompose()
+    root = tree.css_first('article') or tree.css_first('main') or tree.body
+    if root is None:
+        return None
+    return root.text(separator=' ', strip=True)
+
+
+def _extract_text(content: str, extractor: str, fast: bool):
+    """
+    Extract article text from raw HTML.
+
+    Module-level (and argument-only) so it stays picklable for
+    ProcessPoolExecutor workers.
+
+    Args:
+        content (str): Raw HTML to extract from.
+        extractor (str): "fast" tries the selectolax path first.
+        fast (bool): Skip trafilatura's fallback extraction chain.
+
+    Returns:
+        Optional[str]: Extracted text, or None when nothing was extracted.
+    """
+    # Tiny bodies (error pages) and documents without a <body> have
+    # nothing worth extracting; skip the parse entirely. The whole buffer
+    # is scanned — large inline CSS/JS/JSON-LD heads routinely push the
+    # tag past any fixed prefix, and the download is already byte-capped
+    # so the scan is negligible next to the parse it guards.
+    if len(content) < 512 or '<body' not in content.lower():
+        return None
+
+    # Fast path first when enabled; trafilatura covers anything the
+    # lightweight extraction gets too little text from
+    extracted_text = None
+    if extractor == "fast" and LexborHTMLParser is not None:
+        extracted_text = _fast_extract_text(content)
+        if extracted_text and len(extracted_text) < 200:
+            extracted_text = None
+
+    if extracted_text is None:
+        # Extract clean text using trafilatura
+        extracted_text = trafilatura.extract(
+            content,
+            fast=fast,
+            include_comments=False,
+            include_tables=True,
+            include_formatting=False,
+            output_format='txt',
+            config=_TRAFILATURA_CONFIG
+        )
+    return extracted_text
+
+
+def _canonical_url(search_result: SearchResult) -> str:
+    """Canonical cache/dedup key for a search result URL."""
+    return search_result.url.encoded_string().rstrip('/').lower()
+
+
+def _with_content(search_result: SearchResult, content: str) -> SearchResult:
+    """
+    Copy a SearchResult with new content, skipping re-validation.
+
+    model_construct avoids the HttpUrl re-parse; every field except content
+    already passed validation when the result was first built.
+    """
+    return SearchResult.model_construct(
+        url=search_result.url,
+        title=search_result.title,
+        snippet=search_result.snippet,
+        content=content
+    )
+
+
+# Shared across WebScraper instances so repeated construction (e.g. one
+# scraper per search query in a server) skips the LoggerFactory setup cost.
+_SCRAPER_LOGGER = None
+
+
+def _get_logger(log_level: str, enabled: bool):
+    """Return the module-wide WebScraper logger, creating it on first use."""
+    global _SCRAPER_LOGGER
+    if _SCRAPER_LOGGER is None:
+        _SCRAPER_LOGGER = LoggerFactory.create_logger("WebScraper", log_level, enabled, "development", buffered=True)
+    else:
+        _SCRAPER_LOGGER.setLevel(log_level.upper() if isinstance(log_level, str) else log_level)
+        _SCRAPER_LOGGER.disabled = not enabled
+    return _SCRAPER_LOGGER
+
 
 class WebScraper:
     """
@@ -19,7 +153,7 @@ class WebScraper:
     Attributes:
         timeout (int): Maximum time (in seconds) to wait for a response.
         max_content_length (int): Upper limit on how much content (in characters) to process.
-        session (requests.Session): Persistent HTTP session for efficient connections.
+        session (httpx.Client): Persistent HTTP/2 client for efficient connections.
         logger: Configured logger instance.
 
     Example:
@@ -30,10 +164,27 @@ class WebScraper:
             enriched = scraper.fetch_multiple(search_results)
         ```
     """
-    
-    def __init__(self, 
-                 timeout: int = 10, 
+
+    # Shared defaults for every session; subclasses can override
+    _DEFAULT_HEADERS = {
+        # Realistic User-Agent to avoid blocking
+        'User-Agent': 'Mozilla/5.0 (compatible; WebSearchBot/1.0; +https://websearch.local/bot)',
+        # Advertise that we only want HTML so servers can 406 instead of
+        # sending a PDF/binary
+        'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.1',
+        # Advertise brotli alongside gzip: CDNs serving br save ~20%
+        # bandwidth over gzip and httpx decompresses transparently
+        'Accept-Encoding': 'gzip, deflate, br, zstd'
+    }
+
+    def __init__(self,
+                 timeout: int = 10,
                  max_content_length: int = 10000,
+                 concurrency: int = 10,
+                 fast_extract: bool = False,
+                 extractor: Literal["fast", "trafilatura"] = "fast",
+                 cache_ttl: int = 3600,
+                 use_process_pool: bool = False,
                  logger_level: str = "INFO",
                  logger_enabled: bool = True,
         ):
@@ -42,20 +193,47 @@ class WebScraper:
 
         Args:
             timeout (int): Request timeout in seconds.
-            max_content_length (int): Maximum size of content (in bytes) to fetch per page.
+            max_content_length (int): Maximum number of characters of
+                extracted content kept per page; the raw download is capped
+                at ~8x this to bound bandwidth.
+            concurrency (int): Maximum number of URLs fetched in parallel.
+            fast_extract (bool): Skip trafilatura's slower fallback extraction
+                chain; faster at the cost of slightly lower recall.
+            extractor (str): "fast" pulls visible text from article/main
+                nodes via selectolax when installed, falling back to
+                trafilatura for pages it extracts too little from;
+                "trafilatura" always runs the full extraction.
+            cache_ttl (int): Seconds to reuse extracted content for a URL
+                before re-fetching it (0 disables the cache).
+            use_process_pool (bool): Run extraction for async batches in a
+                ProcessPoolExecutor so parsing parallelizes across cores;
+                worthwhile for large batches of big pages.
             logger_level (str): Logging level ("DEBUG", "INFO", etc.).
             logger_enabled (bool): Whether logging is active.
         """
         self.timeout = timeout
         self.max_content_length = max_content_length
-        self.session = requests.Session()
-        
-        # Set a realistic User-Agent to avoid blocking
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (compatible; WebSearchBot/1.0; +https://websearch.local/bot)'
-        })
+        self.concurrency = concurrency
+        self.fast_extract = fast_extract
+        self.extractor = extractor
+        self.cache_ttl = cache_ttl
+        self.use_process_pool = use_process_pool
+        self._cpu_pool = None  # created lazily on first async extraction
+        # Extracted text plus HTTP validators per canonical URL:
+        # {key: {'ts': monotonic stamp, 'text': ..., 'etag': ..., 'last_modified': ...}}
+        self._content_cache = {}
+        # HTTP/2 client: multiplexes concurrent fetches to the same origin
+        # over one connection and keeps TLS handshakes off repeat hits
+        self.session = httpx.Client(
+            http2=True,
+            timeout=timeout,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20)
+        )
+
+        self.session.headers.update(self._DEFAULT_HEADERS)
 
-        self.logger = LoggerFactory.create_logger("WebScraper", logger_level, logger_enabled, "development")
+        self.logger = _get_logger(logger_level, logger_enabled)
 
         
     def fetch_content(self, search_result: SearchResult, max_content_length: int = None) -> SearchResult:
@@ -73,88 +251,362 @@ class WebScraper:
         max_content_length = max_content_length or self.max_content_length
         try:
             url = search_result.url.encoded_string()
-            self.logger.info(f"Scraping content from: {url}")
-            parsed = urlparse(url)
-            self.logger.debug(f"Parsed URL to scrape: {parsed}")
-            if not parsed.scheme or not parsed.netloc:
-                self.logger.warning(f"Invalid URL format: {url}")
-                return search_result
-            
-            # Fetch the webpage
-            response = self.session.get(
-                url, 
-                timeout=self.timeout,
-                allow_redirects=True,
-                stream=True  # Use streaming to handle large files
-            )
+            cache_key = _canonical_url(search_result)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                self.logger.info("Reusing cached content for %s", url)
+                return _with_content(search_result, cached)
+
+            self.logger.info("Scraping content from: %s", url)
+            # No scheme/netloc validation needed: HttpUrl already guarantees
+            # both at SearchResult construction time.
+
+            # The download budget is ~8x the char budget (typical
+            # HTML-to-text ratio) so extraction still sees enough markup
+            byte_budget = max_content_length * 8
+
+            # Cheap HEAD probe: skip the GET for non-HTML or
+            # file-download-class resources before any body transfer starts.
+            # Servers that reject HEAD fall through to the GET, whose
+            # streaming cap still bounds the transfer.
             try:
-                response.raise_for_status()
-            except requests.exceptions.HTTPError as e:
-                self.logger.error(f"HTTP error {e.response.status_code} while fetching {url}")
+                head = self.session.head(url)
+            except httpx.RequestError:
+                head = None
+            if self._head_rejects(head, url):
                 return search_result
 
-            self.logger.debug(f"Response status code: {response.status_code}")
-            
-            # Check content type
-            content_type = response.headers.get('content-type', '').lower()
-            if 'text/html' not in content_type:
-                self.logger.warning(f"Non-HTML content type for {url}: {content_type}")
-                return search_result
-            
-            # Fetch all content first
-            content = ""
-            for chunk in response.iter_content(chunk_size=8192, decode_unicode=True):
-                if chunk:
-                    content += chunk
-            
-            # Extract clean text using trafilatura
-            extracted_text = trafilatura.extract(
-                content,
-                include_comments=False,
-                include_tables=True,
-                include_formatting=False,
-                output_format='txt'
-            )
-            
-            # Truncate extracted text if it exceeds max length
-            if extracted_text and len(extracted_text) > max_content_length:
-                self.logger.warning(f"Extracted content too large for {url}, truncating at {max_content_length} chars")
-                extracted_text = extracted_text[:max_content_length]
+            # Fetch the webpage, streaming so large files never land in memory.
+            # The stream context defers the body read, so a failed content-type
+            # check below returns the connection to the pool without a download.
+            # A stale cache entry contributes If-None-Match/If-Modified-Since.
+            with self.session.stream("GET", url, headers=self._conditional_headers(cache_key)) as response:
+                if response.status_code == 304:
+                    self.logger.info("Content unchanged (304) for %s, reusing cached extraction", url)
+                    return _with_content(search_result, self._cache_refresh(cache_key))
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    self.logger.error("HTTP error %s while fetching %s", e.response.status_code, url)
+                    return search_result
 
-            self.logger.debug(format_for_log(f"Extracted {len(extracted_text)} chars from {url}", extracted_text[:300] + "..."))
-            
-            if not extracted_text:
-                self.logger.warning(f"No content extracted from {url}")
-                return search_result
-            
-            # Basic cleaning - remove excessive whitespace
-            cleaned_text = ' '.join(extracted_text.split())
-            
-            self.logger.info(f"Successfully extracted {len(cleaned_text)} characters from {url}")
-
-            new_search_result = search_result.model_copy(update={"content": cleaned_text})
-            return new_search_result
-            
-        except requests.exceptions.Timeout:
-            self.logger.error(f"Timeout while fetching {url}")
+                self.logger.debug("Response status code: %s", response.status_code)
+
+                # Check content type
+                content_type = response.headers.get('content-type', '').lower()
+                if 'text/html' not in content_type:
+                    self.logger.warning("Non-HTML content type for %s: %s", url, content_type)
+                    return search_result
+
+                # Accumulate raw bytes and decode once at the end; concatenating
+                # str chunks re-copies the whole buffer on every iteration.
+                # 64KiB chunks keep the Python-level loop short for big pages.
+                buf = bytearray()
+                for chunk in response.iter_bytes(chunk_size=65536):
+                    if self._accumulate(buf, chunk, byte_budget, url):
+                        break
+                content = buf.decode(response.encoding or 'utf-8', errors='replace')
+
+            return self._extract_and_clean(search_result, content, url, max_content_length, response.headers)
+
+        except httpx.TimeoutException:
+            self.logger.error("Timeout while fetching %s", url)
             return search_result
-        except requests.exceptions.ConnectionError:
-            self.logger.error(f"Connection error while fetching {url}")
+        except httpx.ConnectError:
+            self.logger.error("Connection error while fetching %s", url)
             return search_result
-        except requests.exceptions.HTTPError as e:
-            self.logger.error(f"HTTP error {e.response.status_code} while fetching {url}")
+        except httpx.HTTPStatusError as e:
+            self.logger.error("HTTP error %s while fetching %s", e.response.status_code, url)
             return search_result
-        except requests.exceptions.RequestException as e:
-            self.logger.error(f"Request error while fetching {url}: {str(e)}")
+        except httpx.RequestError as e:
+            self.logger.error("Request error while fetching %s: %s", url, str(e))
             return search_result
         except Exception as e:
-            self.logger.error(f"Unexpected error while processing {url}: {str(e)}")
+            self.logger.error("Unexpected error while processing %s: %s", url, str(e))
             return search_result
-    
+
+    def _head_rejects(self, head, url: str) -> bool:
+        """
+        Decide from a HEAD response whether the GET should be skipped.
+
+        Shared by the sync and async fetch paths. True for non-HTML
+        resources and for file-download-class sizes (_HEAD_SKIP_BYTES);
+        normal pages over the byte budget still fetch, since the capped
+        streaming GET bounds the transfer and extracts from the prefix.
+        A failed or rejected HEAD (None / non-2xx) never rejects.
+        """
+        if head is None or not head.is_success:
+            return False
+        head_type = head.headers.get('content-type', '').lower()
+        if head_type and 'text/html' not in head_type:
+            self.logger.warning("Skipping non-HTML resource %s: %s", url, head_type)
+            return True
+        head_length = head.headers.get('content-length', '')
+        if head_length.isdigit() and int(head_length) > _HEAD_SKIP_BYTES:
+            self.logger.warning("Skipping %s: content-length %s exceeds %s bytes", url, head_length, _HEAD_SKIP_BYTES)
+            return True
+        return False
+
+    def _accumulate(self, buf: bytearray, chunk: bytes, byte_budget: int, url: str) -> bool:
+        """
+        Append a body chunk to the download buffer, enforcing the byte budget.
+
+        Shared by the sync and async streaming loops. Returns True once the
+        budget is reached, with the buffer trimmed to exactly the budget.
+        """
+        if chunk:
+            buf.extend(chunk)
+            if len(buf) > byte_budget:
+                self.logger.warning("Response body for %s exceeds %s bytes, truncating download", url, byte_budget)
+                del buf[byte_budget:]
+                return True
+        return False
+
+    def _cache_get(self, key: str):
+        """Return cached extracted text for a canonical URL key while fresh, or None.
+
+        Stale entries are retained: their ETag/Last-Modified validators let a
+        later fetch revalidate with a conditional GET instead of a full download.
+        """
+        if not self.cache_ttl:
+            return None
+        entry = self._content_cache.get(key)
+        if entry is not None and time.monotonic() - entry['ts'] <= self.cache_ttl:
+            return entry['text']
+        return None
+
+    def _cache_put(self, key: str, text: str, etag: str = None, last_modified: str = None):
+        """Cache extracted text and HTTP validators, evicting the oldest entry when full."""
+        if not self.cache_ttl:
+            return
+        if key not in self._content_cache and len(self._content_cache) >= _CACHE_MAXSIZE:
+            self._content_cache.pop(next(iter(self._content_cache)))
+        self._content_cache[key] = {
+            'ts': time.monotonic(),
+            'text': text,
+            'etag': etag,
+            'last_modified': last_modified
+        }
+
+    def _conditional_headers(self, key: str):
+        """Validator headers for a stale cache entry, or None when there is nothing to revalidate."""
+        if not self.cache_ttl:
+            return None
+        entry = self._content_cache.get(key)
+        if entry is None:
+            return None
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers or None
+
+    def _cache_refresh(self, key: str) -> str:
+        """Re-stamp a revalidated (HTTP 304) entry and return its text."""
+        entry = self._content_cache[key]
+        entry['ts'] = time.monotonic()
+        return entry['text']
+
+    def _extract_and_clean(self, search_result: SearchResult, content: str, url: str, max_content_length: int, response_headers=None) -> SearchResult:
+        """
+        Extract clean text from fetched HTML and attach it to a SearchResult.
+
+        Args:
+            search_result (SearchResult): The search result the content belongs to.
+            content (str): Raw HTML fetched from the result URL.
+            url (str): The URL the content was fetched from (for logging).
+            max_content_length (int): Maximum number of characters to keep.
+            response_headers: Headers of the fetched response; ETag and
+                Last-Modified are kept alongside the cached text so later
+                fetches can revalidate instead of re-downloading.
+
+        Returns:
+            SearchResult: A new SearchResult with extracted content in the `content` field.
+                          If extraction fails, the original SearchResult is returned unmodified.
+        """
+        extracted_text = _extract_text(content, self.extractor, self.fast_extract)
+        return self._finalize_result(search_result, extracted_text, url, max_content_length, response_headers)
+
+    def _finalize_result(self, search_result: SearchResult, extracted_text, url: str, max_content_length: int, response_headers=None) -> SearchResult:
+        """
+        Truncate, clean, cache and attach already-extracted text to a SearchResult.
+
+        Args:
+            search_result (SearchResult): The search result the content belongs to.
+            extracted_text: Raw extracted text, or None when extraction failed.
+            url (str): The URL the content was fetched from (for logging).
+            max_content_length (int): Maximum number of characters to keep.
+            response_headers: Headers of the fetched response (for cache validators).
+
+        Returns:
+            SearchResult: A new SearchResult carrying the cleaned content, or
+                          the original when there is no usable text.
+        """
+        # Truncate extracted text if it exceeds max length
+        if extracted_text and len(extracted_text) > max_content_length:
+            self.logger.warning("Extracted content too large for %s, truncating at %s chars", url, max_content_length)
+            extracted_text = extracted_text[:max_content_length]
+
+        if not extracted_text:
+            self.logger.warning("No content extracted from %s", url)
+            return search_result
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(format_for_log(f"Extracted {len(extracted_text)} chars from {url}", extracted_text[:300] + "..."))
+
+        # Basic cleaning - remove excessive whitespace
+        cleaned_text = _WS_RE.sub(' ', extracted_text).strip()
+
+        self.logger.info("Successfully extracted %s characters from %s", len(cleaned_text), url)
+
+        response_headers = response_headers or {}
+        self._cache_put(
+            _canonical_url(search_result),
+            cleaned_text,
+            etag=response_headers.get('etag'),
+            last_modified=response_headers.get('last-modified')
+        )
+
+        return _with_content(search_result, cleaned_text)
+
+    async def afetch_content(self, search_result: SearchResult, client: httpx.AsyncClient, max_content_length: int = None) -> SearchResult:
+        """
+        Asynchronously fetch and extract cleaned textual content from a single SearchResult.
+
+        Args:
+            search_result (SearchResult): A single search result object containing a URL.
+            client (httpx.AsyncClient): Shared async HTTP client to issue the request on.
+            max_content_length (int): Maximum number of characters to fetch from each result.
+
+        Returns:
+            SearchResult: A new SearchResult with extracted content in the `content` field.
+                          If extraction fails, the original SearchResult is returned unmodified.
+        """
+        max_content_length = max_content_length or self.max_content_length
+        url = search_result.url.encoded_string()
+        try:
+            cache_key = _canonical_url(search_result)
+            cached = self._cache_get(cache_key)
+            if cached is not None:
+                self.logger.info("Reusing cached content for %s", url)
+                return _with_content(search_result, cached)
+
+            self.logger.info("Scraping content from: %s", url)
+
+            # Same download budget as the sync path: ~8x the char budget
+            byte_budget = max_content_length * 8
+
+            # Cheap HEAD probe, as in the sync path: skip the GET for
+            # non-HTML or file-download-class resources before any body
+            # transfer.
+            try:
+                head = await client.head(url)
+            except httpx.RequestError:
+                head = None
+            if self._head_rejects(head, url):
+                return search_result
+
+            # Stream so the body read is deferred: a failed status or
+            # content-type check below costs no transfer, and the capped
+            # loop bounds what an oversized page can download.
+            async with client.stream("GET", url, headers=self._conditional_headers(cache_key)) as response:
+                if response.status_code == 304:
+                    self.logger.info("Content unchanged (304) for %s, reusing cached extraction", url)
+                    return _with_content(search_result, self._cache_refresh(cache_key))
+                try:
+                    response.raise_for_status()
+                except httpx.HTTPStatusError as e:
+                    self.logger.error("HTTP error %s while fetching %s", e.response.status_code, url)
+                    return search_result
+
+                self.logger.debug("Response status code: %s", response.status_code)
+
+                # Check content type
+                content_type = response.headers.get('content-type', '').lower()
+                if 'text/html' not in content_type:
+                    self.logger.warning("Non-HTML content type for %s: %s", url, content_type)
+                    return search_result
+
+                buf = bytearray()
+                async for chunk in response.aiter_bytes(chunk_size=65536):
+                    if self._accumulate(buf, chunk, byte_budget, url):
+                        break
+                content = buf.decode(response.encoding or 'utf-8', errors='replace')
+
+            # Extraction is CPU-bound work; run it off the event loop so
+            # pending fetches keep draining while this page is parsed. With a
+            # process pool, extraction additionally parallelizes across cores.
+            if self.use_process_pool:
+                extracted_text = await asyncio.get_running_loop().run_in_executor(
+                    self._get_cpu_pool(), _extract_text, content, self.extractor, self.fast_extract
+                )
+                return self._finalize_result(search_result, extracted_text, url, max_content_length, response.headers)
+            return await asyncio.to_thread(
+                self._extract_and_clean, search_result, content, url, max_content_length, response.headers
+            )
+
+        except httpx.TimeoutException:
+            self.logger.error("Timeout while fetching %s", url)
+            return search_result
+        except httpx.RequestError as e:
+            self.logger.error("Request error while fetching %s: %s", url, str(e))
+            return search_result
+        except Exception as e:
+            self.logger.error("Unexpected error while processing %s: %s", url, str(e))
+            return search_result
+
+    async def afetch_multiple(self, search_results: SearchResults, max_content_length: int = None) -> SearchResults:
+        """
+        Concurrently fetch content from multiple SearchResult objects and return enriched results.
+
+        All URLs are fetched in parallel on a shared connection pool, so wall-clock
+        time is roughly the slowest single fetch instead of the sum of all fetches.
+
+        Args:
+            search_results (SearchResults): A collection of search results to process.
+            max_content_length (int): Maximum number of characters to fetch from each result.
+        Returns:
+            SearchResults: A new SearchResults object with each entry enriched
+                           with extracted content if successful.
+        """
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                format_for_log(
+                    f"Fetching content from {len(search_results.data)} URLs",
+                    [f"{i}. {item.url.encoded_string()}" for i, item in enumerate(search_results.data)]
+                )
+            )
+
+        unique = self._dedupe(search_results)
+
+        limits = httpx.Limits(max_connections=20, max_keepalive_connections=10)
+        async with httpx.AsyncClient(
+            http2=True,
+            timeout=self.timeout,
+            follow_redirects=True,
+            headers=dict(self.session.headers),
+            limits=limits
+        ) as client:
+            results = await asyncio.gather(
+                *(self.afetch_content(search_result, client, max_content_length) for search_result in unique.values()),
+                return_exceptions=True
+            )
+
+        # Fall back to the original result for any task that raised
+        enriched_by_key = {
+            key: (representative, result if isinstance(result, SearchResult) else representative)
+            for (key, representative), result in zip(unique.items(), results)
+        }
+        return self._fan_out(search_results, enriched_by_key)
+
     def fetch_multiple(self, search_results: SearchResults, max_content_length: int = None) -> SearchResults:
         """
         Fetch content from multiple SearchResult objects and return enriched results.
 
+        Synchronous wrapper around `afetch_multiple`; all URLs are still fetched
+        concurrently under the hood.
+
         Args:
             search_results (SearchResults): A collection of search results to process.
             max_content_length (int): Maximum number of characters to fetch from each result.
@@ -162,24 +614,97 @@ class WebScraper:
             SearchResults: A new SearchResults object with each entry enriched
                            with extracted content if successful.
         """
-        self.logger.info(
-            format_for_log(
-                f"Fetching content from {len(search_results.data)} URLs", 
-                [f"{i}. {item.url.encoded_string()}" for i, item in enumerate(search_results.data)]
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.afetch_multiple(search_results, max_content_length))
+
+        # Called from inside a running event loop (e.g. _ainvoke); asyncio.run
+        # would raise here, so fan out over a thread pool instead. The client
+        # releases the GIL during socket I/O, so this stays close to async
+        # throughput for typical batch sizes.
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info(
+                format_for_log(
+                    f"Fetching content from {len(search_results.data)} URLs",
+                    [f"{i}. {item.url.encoded_string()}" for i, item in enumerate(search_results.data)]
+                )
             )
-        )
+        unique = self._dedupe(search_results)
+        max_workers = min(self.concurrency, max(len(unique), 1))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(
+                lambda search_result: self.fetch_content(search_result, max_content_length),
+                unique.values()
+            ))
+        enriched_by_key = {
+            key: (representative, result)
+            for (key, representative), result in zip(unique.items(), results)
+        }
+        return self._fan_out(search_results, enriched_by_key)
+
+    def _dedupe(self, search_results: SearchResults) -> dict:
+        """
+        Group search results by canonical URL so each page is fetched once.
+
+        Args:
+            search_results (SearchResults): The results to group.
 
-        new_results = search_results.model_copy(update={"data": []})
+        Returns:
+            dict: Mapping of canonical URL key to the first SearchResult seen
+                  for that URL.
+        """
+        unique = {}
         for search_result in search_results.data:
-            new_results.data.append(self.fetch_content(search_result, max_content_length))
-        return new_results
+            unique.setdefault(_canonical_url(search_result), search_result)
+        if len(unique) < len(search_results.data):
+            self.logger.info("Deduplicated %s URLs down to %s unique fetches", len(search_results.data), len(unique))
+        return unique
+
+    def _fan_out(self, search_results: SearchResults, enriched_by_key: dict) -> SearchResults:
+        """
+        Replay content fetched for unique URLs onto every original result.
+
+        Args:
+            search_results (SearchResults): The original (possibly duplicated) results.
+            enriched_by_key (dict): Canonical URL key -> (representative, enriched result).
+
+        Returns:
+            SearchResults: Results in the original order, each carrying the
+                           content fetched for its canonical URL.
+        """
+        data = []
+        for search_result in search_results.data:
+            representative, enriched = enriched_by_key[_canonical_url(search_result)]
+            if search_result is representative:
+                data.append(enriched)
+            elif enriched is representative:
+                # Fetch failed for this URL; leave the duplicate untouched
+                data.append(search_result)
+            else:
+                data.append(_with_content(search_result, enriched.content))
+        return SearchResults.model_construct(data=data)
     
+    def _get_cpu_pool(self) -> ProcessPoolExecutor:
+        """Lazily create the extraction worker pool (spawn context for fork safety)."""
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(
+                max_workers=os.cpu_count(),
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        return self._cpu_pool
+
     def close(self):
         """
         Release the HTTP session and free associated resources.
         Recommended when not using the context manager interface.
-        """        
+        """
         self.session.close()
+        if self._cpu_pool is not None:
+            self._cpu_pool.shutdown()
+            self._cpu_pool = None
+        for handler in self.logger.handlers:
+            handler.flush()
     
     def __enter__(self):
         """
@@ -2,16 +2,41 @@
 
 # Standard Library
 import asyncio
+import atexit
+import logging
+import time
 from enum import Enum
-from typing import Literal
+from typing import Literal, Optional
 # Third Party
-import httpx
 from ddgs import DDGS
 from ddgs.engines import ENGINES
 # Core
 from websearch import SearchResult, SearchResults, WebScraper
+from websearch.engines import search_all
 from websearch.logging import LoggerFactory, format_for_log
 
+# One WebScraper for the whole process. What survives across invoke/ainvoke
+# calls is the extracted-content cache (with its ETag/Last-Modified
+# validators) and the sync session; the async path builds a fresh
+# AsyncClient per batch, so no cross-invocation keep-alive there.
+_shared_scraper: Optional[WebScraper] = None
+
+
+def _get_shared_scraper() -> WebScraper:
+    """Return the process-wide WebScraper, creating it on first use."""
+    global _shared_scraper
+    if _shared_scraper is None:
+        _shared_scraper = WebScraper()
+        atexit.register(_shared_scraper.close)
+    return _shared_scraper
+
+
+# Raw backend results per (query, backend, safesearch, max_results):
+# {key: (monotonic timestamp, results)}. Agent loops repeat near-identical
+# queries, turning a multi-hundred-ms backend round-trip into a dict lookup.
+_SEARCH_CACHE = {}
+_SEARCH_CACHE_MAXSIZE = 512
+
 
 class Backends(str, Enum):
     DUCKDUCKGO = "duckduckgo"
@@ -20,6 +45,9 @@ class Backends(str, Enum):
     BRAVE = "brave"
     YAHOO = "yahoo"
     YANDEX = "yandex"
+    # Fan the query out to every direct engine integration concurrently
+    # (see websearch.engines) and merge the results, deduped by URL.
+    ALL = "all"
 
 class WebSearch:
     """
@@ -46,6 +74,7 @@ class WebSearch:
     safesearch: str = "moderate"
     backend: Backends = Backends.GOOGLE
     fetch_content_max_chars: int = 10000
+    cache_ttl: int = 300
 
     def __init__(self, log_level: str = "INFO", log_enabled: bool = False):
         """
@@ -67,8 +96,9 @@ class WebSearch:
                        max_results: int = None, 
                        fetch_content: bool = None, 
                        fetch_content_max_chars: int = None,
-                       safesearch: str = None, 
-                       backend: Backends = None
+                       safesearch: str = None,
+                       backend: Backends = None,
+                       cache_ttl: int = None
         ) -> SearchResults:
         """
         Internal async method that performs the core search logic.
@@ -80,54 +110,101 @@ class WebSearch:
             fetch_content_max_chars (int): Maximum number of characters to fetch from each result.
             safesearch (str): Safe search mode for content filtering.
             backend (Backends): The search engine backend to use.
+            cache_ttl (int): Seconds to reuse backend results for an identical
+                query (0 disables the cache).
 
         Returns:
             SearchResults: A list of structured search results with optional full content.
         """
-        max_results = max_results or self.max_results
-        fetch_content = fetch_content or self.fetch_content
-        fetch_content_max_chars = fetch_content_max_chars or self.fetch_content_max_chars
-        safesearch = safesearch or self.safesearch
-        backend = backend or self.backend
-
-        self.logger.info(f"Searching for '{query}' on {backend}")
-        self.logger.info(f"Config: max results = {max_results}, fetch content = {fetch_content}, w max chars = {fetch_content_max_chars}, safesearch = '{safesearch}'")
-
-        async with httpx.AsyncClient() as client:
-            # Get search results
-            with DDGS() as ddgs:
-                raw_ddgs_search_results = ddgs.text(
-                    query, safesearch=safesearch, max_results=max_results, backend=backend
+        # `is None` rather than truthiness: explicit falsy overrides like
+        # fetch_content=False or max_results=0 must not silently fall back
+        # to the class defaults.
+        max_results = self.max_results if max_results is None else max_results
+        fetch_content = self.fetch_content if fetch_content is None else fetch_content
+        fetch_content_max_chars = self.fetch_content_max_chars if fetch_content_max_chars is None else fetch_content_max_chars
+        safesearch = self.safesearch if safesearch is None else safesearch
+        backend = self.backend if backend is None else backend
+        cache_ttl = self.cache_ttl if cache_ttl is None else cache_ttl
+
+        self.logger.info("Searching for '%s' on %s", query, backend)
+        self.logger.info("Config: max results = %s, fetch content = %s, w max chars = %s, safesearch = '%s'", max_results, fetch_content, fetch_content_max_chars, safesearch)
+
+        cache_key = (query, str(backend), safesearch, max_results)
+        raw_ddgs_search_results = None
+        if cache_ttl:
+            entry = _SEARCH_CACHE.get(cache_key)
+            if entry is not None and time.monotonic() - entry[0] <= cache_ttl:
+                self.logger.info("Reusing cached search results for '%s'", query)
+                raw_ddgs_search_results = entry[1]
+
+        if raw_ddgs_search_results is None:
+            if backend == Backends.ALL:
+                # Hit the direct engine integrations concurrently on this
+                # event loop; ddgs below stays as the fallback when none of
+                # them produce results (blocked network, reshaped markup).
+                raw_ddgs_search_results = await search_all(
+                    query, safesearch=safesearch, max_results=max_results
                 )
 
-            self.logger.info(f"Fetched {len(raw_ddgs_search_results)} results from {self.backend}")
-            self.logger.debug(format_for_log("Raw DDGS Search Results", raw_ddgs_search_results))
+            if not raw_ddgs_search_results:
+                # Get search results. DDGS is synchronous, so run it in a
+                # worker thread — otherwise the full backend round-trip blocks
+                # the event loop and concurrent ainvoke calls serialize
+                # behind it.
+                ddgs_backend = "auto" if backend == Backends.ALL else backend
 
-            search_results : SearchResults = SearchResults(data=[])
+                def _search():
+                    with DDGS() as ddgs:
+                        return ddgs.text(
+                            query, safesearch=safesearch, max_results=max_results, backend=ddgs_backend
+                        )
 
-            # Convert to SearchResults
-            for result in raw_ddgs_search_results:
-                search_results.data.append(SearchResult(
-                    url=result.get("href"),
-                    title=result.get("title") or "no title from ddgs",
-                    snippet=result.get("body") or "no body from ddgs",
-                    content=result.get("body") or "no body from ddgs"
-                ))
+                raw_ddgs_search_results = await asyncio.to_thread(_search)
 
-            self.logger.debug(format_for_log("DDGS SearchResults", search_results.model_dump()))
+            # Only cache useful answers; empty or failed lookups should retry
+            if cache_ttl and raw_ddgs_search_results:
+                if cache_key not in _SEARCH_CACHE and len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAXSIZE:
+                    _SEARCH_CACHE.pop(next(iter(_SEARCH_CACHE)))
+                _SEARCH_CACHE[cache_key] = (time.monotonic(), raw_ddgs_search_results)
+
+        self.logger.info("Fetched %s results from %s", len(raw_ddgs_search_results), self.backend)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(format_for_log("Raw DDGS Search Results", raw_ddgs_search_results))
 
-            # Convert each SearchResult to dict and collect in a list
-            # results_as_dicts = [result.model_dump() for result in search_results.results]
+        # Convert to SearchResults. Each SearchResult is validated (backend
+        # data is untrusted), but the container is built once from the
+        # already-validated items rather than re-validated per append.
+        search_results : SearchResults = SearchResults.model_construct(data=[
+            SearchResult(
+                url=result.get("href"),
+                title=result.get("title") or "no title from ddgs",
+                snippet=result.get("body") or "no body from ddgs",
+                content=result.get("body") or "no body from ddgs"
+            )
+            for result in raw_ddgs_search_results
+        ])
 
-            if fetch_content:
-                # Fetch content from each URL
-                self.logger.info("Scraping content for search results...")
-                with WebScraper() as scraper:
-                    search_results = scraper.fetch_multiple(search_results, max_content_length=fetch_content_max_chars)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            # Pass the model itself: format_for_log serializes BaseModels in
+            # pydantic-core instead of a model_dump + stdlib json round-trip
+            self.logger.debug(format_for_log("DDGS SearchResults", search_results))
 
-                self.logger.debug(format_for_log("WebScraper Results", search_results.model_dump()))
+        # Convert each SearchResult to dict and collect in a list
+        # results_as_dicts = [result.model_dump() for result in search_results.results]
 
-            return search_results
+        if fetch_content:
+            # Fetch content from each URL, concurrently on this event loop.
+            # The shared scraper's content cache persists across invocations,
+            # so repeat URLs skip the network entirely; connections only
+            # stay pooled within this batch.
+            self.logger.info("Scraping content for search results...")
+            scraper = _get_shared_scraper()
+            search_results = await scraper.afetch_multiple(search_results, max_content_length=fetch_content_max_chars)
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(format_for_log("WebScraper Results", search_results))
+
+        return search_results
 
     @classmethod
     def invoke(cls, 
@@ -136,7 +213,8 @@ class WebSearch:
             fetch_content: bool = None, 
             fetch_content_max_chars: int = None,
             safesearch: str = None, 
-            backend: Backends = None, 
+            backend: Backends = None,
+            cache_ttl: int = None,
             log_level: str = None, 
             log_enabled: bool = None
         ) -> SearchResults:
@@ -150,6 +228,8 @@ class WebSearch:
             fetch_content_max_chars (int): Maximum number of characters to fetch from each result.
             safesearch (str): Safesearch filtering level.
             backend (Backends): Search backend to use.
+            cache_ttl (int): Seconds to reuse backend results for an identical
+                query (0 disables the cache).
             log_level (str): Optional log level override.
             log_enabled (bool): Optional logging toggle.
 
@@ -157,7 +237,7 @@ class WebSearch:
             SearchResults: Structured, optionally enriched search results.
         """
         instance = cls(log_level, log_enabled)
-        return asyncio.run(instance._ainvoke(query, max_results, fetch_content, fetch_content_max_chars, safesearch, backend))
+        return asyncio.run(instance._ainvoke(query, max_results, fetch_content, fetch_content_max_chars, safesearch, backend, cache_ttl))
 
     @classmethod
     async def ainvoke(cls, 
@@ -167,6 +247,7 @@ class WebSearch:
             fetch_content_max_chars: int = None,
             safesearch: str = None, 
             backend: Backends = None,
+            cache_ttl: int = None,
             log_level: str = "INFO", 
             log_enabled: bool = False
         ) -> SearchResults:
@@ -180,6 +261,8 @@ class WebSearch:
             fetch_content_max_chars (int): Maximum number of characters to fetch from each result.
             safesearch (str): Safesearch filtering level.
             backend (Backends): Search backend to use.
+            cache_ttl (int): Seconds to reuse backend results for an identical
+                query (0 disables the cache).
             log_level (str): Optional log level override.
             log_enabled (bool): Optional logging toggle.
 
@@ -187,4 +270,4 @@ class WebSearch:
             SearchResults: Structured, optionally enriched search results.
         """
         instance = cls(log_level, log_enabled)
-        return await instance._ainvoke(query, max_results, fetch_content, fetch_content_max_chars, safesearch, backend)
\ No newline at end of file
+        return await instance._ainvoke(query, max_results, fetch_content, fetch_content_max_chars, safesearch, backend, cache_ttl)
\ No newline at end of file